@@ -1,13 +1,23 @@
 import streamlit as st
 import pandas as pd
-import matplotlib.pyplot as plt
 from ultralytics import YOLO
-from PIL import Image, ImageDraw
-import numpy as np
 
-import os, json, random, cv2, time
-import folium
+import os, random, cv2, time
 from streamlit_folium import st_folium
+from frame_pool import FramePool, FrameAllocationProbe
+from leaderboard import Leaderboard, ALL_MATERIALS
+from ecosort_core import (
+    MATERIALS, MATERIAL_COLORS, new_detection_count, new_detection_history, record_detection,
+    summarize_history, format_history, build_overview_chart, build_tracking_chart, detect_material,
+    load_user_data, save_user_data, sanitize_username, user_data_path, DEFAULT_USER,
+    AVATAR_THEMES, voucher_display_order, build_voucher_image, build_recycling_map, hash_pin, verify_pin,
+)
+
+# 🏆 One leaderboard per server process, shared by every resident's session
+@st.cache_resource
+def get_leaderboard():
+    return Leaderboard.load()
+
 # 🚀 App Logo (Left Side)
 st.sidebar.image("ecosort_logo3.png", width=450)
 
@@ -17,16 +27,26 @@ if "accepted_terms" not in st.session_state:
 
 # ✅ Initialize detection counts & history
 if "detection_count" not in st.session_state:
-    st.session_state.detection_count = {"Cardboard": 0, "Metal": 0, "Paper": 0, "Plastic": 0}
+    st.session_state.detection_count = new_detection_count()
 
 if "detection_history" not in st.session_state:
-    st.session_state.detection_history = pd.DataFrame(columns=["Timestamp", "Material", "Credits"])
+    st.session_state.detection_history = new_detection_history()
 
 if "webcam_active" not in st.session_state:
     st.session_state.webcam_active = False
 
+# 👤 Resident Account (session stats start fresh when switching residents)
+username = sanitize_username(st.sidebar.text_input("👤 Resident Username", value=st.session_state.get("username", DEFAULT_USER)))
+if username != st.session_state.get("username"):
+    st.session_state.username = username
+    st.session_state.detection_count = new_detection_count()
+    st.session_state.detection_history = new_detection_history()
+    st.session_state.pop("last_detection_time", None)
+
+leaderboard = get_leaderboard()
+
 # ✅ Dropdown Menu with Tabs
-menu = st.sidebar.selectbox("Navigation", ["Terms & Conditions", "Ecosort's Overview", "Waste Tracking", "Materials Recognition", "Eco Gallery", "EcoPoints Redemption"])
+menu = st.sidebar.selectbox("Navigation", ["Terms & Conditions", "Ecosort's Overview", "Waste Tracking", "Materials Recognition", "Eco Gallery", "EcoPoints Redemption", "Leaderboard"])
 
 # ✅ Terms & Conditions Tab
 if menu == "Terms & Conditions":
@@ -86,7 +106,7 @@ if menu == "Ecosort's Overview":
         selected_month = st.selectbox("📅 Select Month", months, index=4)
 
         # ✅ Detection Data
-        df = pd.DataFrame(list(st.session_state.detection_count.items()), columns=["Material", "Count"])
+        df, fig = build_overview_chart(st.session_state.detection_count, selected_month)
         total = df["Count"].sum()
         top_material = df.loc[df["Count"].idxmax(), "Material"] if not df.empty else "None"
 
@@ -98,25 +118,11 @@ if menu == "Ecosort's Overview":
         col3.metric("Unique Materials", df.shape[0])
 
         # 🎨 Live Bar Chart (Styled)
-        fig, ax = plt.subplots(figsize=(8, 5))
-        colors = {"Cardboard": "#66bb6a", "Metal": "#fdd835", "Paper": "#ef5350", "Plastic": "#42a5f5"}
-        bars = ax.bar(df["Material"], df["Count"], color=[colors.get(m, "#9e9e9e") for m in df["Material"]])
-
-        ax.set_ylabel("🔢 Detection Count", fontsize=12)
-        ax.set_title(f"📦 Detected Materials in {selected_month}", fontsize=14)
-        ax.set_facecolor("#f9f9f9")
-        fig.patch.set_facecolor("#f9f9f9")
-
-        for bar in bars:
-            height = bar.get_height()
-            ax.annotate(f'{height}', xy=(bar.get_x() + bar.get_width() / 2, height),
-                        xytext=(0, 3), textcoords="offset points", ha='center', fontsize=10)
-
         st.pyplot(fig)
 
         # ℹ️ Optional Legend
         with st.expander("ℹ️ What Each Color Means"):
-            for mat, col in colors.items():
+            for mat, col in MATERIAL_COLORS.items():
                 st.markdown(f"- <span style='color:{col}'>●</span> **{mat}**", unsafe_allow_html=True)
 
 
@@ -130,14 +136,7 @@ if menu == "Waste Tracking":
         st.markdown("Track how your detected materials are contributing to recycling rewards and environmental impact over time.")
 
         # 📊 Summary Metrics
-        if not st.session_state.detection_history.empty:
-            total_credits = st.session_state.detection_history["Credits"].sum()
-            total_detections = len(st.session_state.detection_history)
-            unique_materials = st.session_state.detection_history["Material"].nunique()
-        else:
-            total_credits = 0
-            total_detections = 0
-            unique_materials = 0
+        total_credits, total_detections, unique_materials = summarize_history(st.session_state.detection_history)
 
         col1, col2, col3 = st.columns(3)
         col1.metric("🏅 Total Credits Earned", f"{total_credits}")
@@ -149,30 +148,7 @@ if menu == "Waste Tracking":
         # 🚀 Dynamic Line Graph (Live Credit Tracking)
         st.markdown("### 📈 Material Deposits Over Time")
 
-        fig, ax = plt.subplots(figsize=(8, 5))
-        colors = {"Cardboard": "#66bb6a", "Metal": "#fdd835", "Paper": "#ef5350", "Plastic": "#42a5f5"}
-
-        for material in st.session_state.detection_count.keys():
-            material_data = st.session_state.detection_history[
-                st.session_state.detection_history["Material"] == material
-            ]
-            if not material_data.empty:
-                ax.plot(
-                    material_data.index,
-                    material_data["Credits"].cumsum(),
-                    label=material,
-                    linewidth=2,
-                    color=colors.get(material, "#9e9e9e"),
-                )
-
-        ax.set_ylabel("Total Credits", fontsize=12)
-        ax.set_xlabel("Detection Event Index", fontsize=12)
-        ax.set_title("📊 Credit Accumulation by Material", fontsize=14)
-        ax.legend(loc="upper left")
-        ax.grid(True, linestyle="--", alpha=0.3)
-        fig.patch.set_facecolor("#f9f9f9")
-        ax.set_facecolor("#f9f9f9")
-
+        fig = build_tracking_chart(st.session_state.detection_history, st.session_state.detection_count.keys())
         st.pyplot(fig)
 
         st.divider()
@@ -180,16 +156,7 @@ if menu == "Waste Tracking":
         # 📋 Material Detection Table
         st.markdown("### 📋 Detected Materials Log")
 
-        if not st.session_state.detection_history.empty:
-            st.session_state.detection_history["Timestamp"] = pd.to_datetime(
-                st.session_state.detection_history["Timestamp"], errors="coerce"
-            )
-            st.session_state.detection_history.dropna(subset=["Timestamp"], inplace=True)
-            st.session_state.detection_history["Date"] = st.session_state.detection_history["Timestamp"].dt.date
-            st.session_state.detection_history["Time"] = st.session_state.detection_history["Timestamp"].dt.time
-            formatted_history = st.session_state.detection_history[["Date", "Time", "Material", "Credits"]]
-        else:
-            formatted_history = pd.DataFrame(columns=["Date", "Time", "Material", "Credits"])
+        formatted_history = format_history(st.session_state.detection_history)
 
         st.dataframe(formatted_history, use_container_width=True)
 
@@ -201,15 +168,6 @@ def run_eco_gallery():
 
     # Load YOLO model once
     model = YOLO("train33/weights/best.pt")
-        
-    # Detect material from image array
-    def detect_material_from_frame(img_array):
-        results = model(img_array)[0]
-        if results.names and results.boxes:
-            class_id = int(results.boxes.cls[0])
-            return results.names[class_id]
-        else:
-            return "unknown"
 
     st.header("🖼️ EcoGallery")
     st.markdown("Snap a photo of a recyclable item using your external camera!")
@@ -241,7 +199,7 @@ def run_eco_gallery():
         st.image(st.session_state.captured_image, caption="📷 Captured Image", channels="RGB")
         
         # Detect material
-        detected_material = detect_material_from_frame(st.session_state.captured_image)
+        detected_material = detect_material(model, st.session_state.captured_image)
         st.write(f"🤖 Detected: **{detected_material.upper()}**")
         
         # User correction
@@ -281,6 +239,8 @@ if menu == "Materials Recognition":
             if col2.button("⏹ Stop Webcam"):
                 st.session_state.webcam_active = False
 
+        trace_allocations = st.checkbox("🧮 Trace per-frame allocations (slows the feed)", key="trace_allocations")
+
         if st.session_state.webcam_active:
             # 📦 Load YOLO model
             model = YOLO("train33/weights/best.pt")
@@ -299,106 +259,123 @@ if menu == "Materials Recognition":
             stframe = st.empty()
             detection_info = st.empty()
             table_display = st.empty()
-
-            # 🎯 Live Detection Loop
-            while st.session_state.webcam_active:
-                ret, frame = cap.read()
-                if not ret:
-                    st.error("❌ Failed to read webcam frame.")
-                    break
-
-                frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                frame = cv2.flip(frame, 1)
-
-                detected_material = "None"
-                detected_credits = 0
-                img_path = None
-
-                # 🔍 Run YOLO on Frame
-                results = model(frame, conf=0.8, iou=0.7, classes=[0, 1, 2, 3])
-                for result in results:
-                    class_ids = result.boxes.cls.cpu().numpy()
-                    for cls_id in class_ids:
-                        material_name = model.names[int(cls_id)].capitalize()
-                        detected_material = material_name
-
-                        # 💾 Save Frame
-                        img_path = f"C:/Practice/AiPD/eco_gallery/{material_name}_{time.strftime('%Y%m%d_%H%M%S')}.jpg"
-                        cv2.imwrite(img_path, cv2.cvtColor(frame, cv2.COLOR_RGB2BGR))
-
-                        # ♻️ Record Detection
-                        if material_name in st.session_state.detection_count:
-                            st.session_state.detection_count[material_name] += 1
-                            credit_mapping = {"Cardboard": 7, "Metal": 10, "Paper": 5, "Plastic": 6}
-                            detected_credits = credit_mapping.get(material_name, 0)
-                            timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
-
-                            new_entry = pd.DataFrame([[timestamp, material_name, detected_credits]],
-                                                     columns=["Timestamp", "Material", "Credits"])
-                            st.session_state.detection_history = pd.concat(
-                                [st.session_state.detection_history, new_entry],
-                                ignore_index=True
-                            )
-
-                # 🖼️ Update Webcam Feed
-                stframe.image(frame, channels="RGB")
-
-                # ✅ Display Detected Material Info
-                if detected_material != "None":
-                    detection_info.success(
-                        f"✅ Detected: **{detected_material}** | 🪙 Credits Earned: **{detected_credits}**"
+            alloc_info = st.empty()
+
+            # 🎞️ Recycled frame buffers (read, flip & colour conversion happen in place)
+            frame_shape = (int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT)), int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)), 3)
+            pool = FramePool(frame_shape)
+            probe = FrameAllocationProbe(enabled=trace_allocations)
+            probe.start()
+
+            # 🎯 Live Detection Loop (widget clicks rerun the script by raising mid-loop,
+            # so clean-up must live in `finally`)
+            try:
+                while st.session_state.webcam_active:
+                    with probe.step("capture"):
+                        ret, slot = pool.read(cap)
+                    if not ret:
+                        st.error("❌ Failed to read webcam frame.")
+                        break
+
+                    frame = slot.rgb
+
+                    detected_material = "None"
+                    detected_credits = 0
+                    img_path = None
+
+                    # 🔍 Run YOLO on Frame
+                    with probe.step("model"):
+                        results = model(frame, conf=0.8, iou=0.7, classes=[0, 1, 2, 3])
+                    for result in results:
+                        class_ids = result.boxes.cls.cpu().numpy()
+                        for cls_id in class_ids:
+                            material_name = model.names[int(cls_id)].capitalize()
+                            detected_material = material_name
+
+                            # 💾 Save Frame
+                            img_path = f"C:/Practice/AiPD/eco_gallery/{material_name}_{time.strftime('%Y%m%d_%H%M%S')}.jpg"
+                            with probe.step("snapshot"):
+                                cv2.imwrite(img_path, slot.bgr)
+
+                            # ♻️ Record Detection
+                            if material_name in st.session_state.detection_count:
+                                st.session_state.detection_count[material_name] += 1
+                                timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
+                                st.session_state.detection_history, detected_credits = record_detection(
+                                    st.session_state.detection_history, material_name, timestamp
+                                )
+                                leaderboard.credit(st.session_state.username, material_name, detected_credits, timestamp)
+
+                    # 🖼️ Update Webcam Feed
+                    with probe.step("display"):
+                        stframe.image(frame, channels="RGB")
+
+                    # ✅ Display Detected Material Info
+                    if detected_material != "None":
+                        detection_info.success(
+                            f"✅ Detected: **{detected_material}** | 🪙 Credits Earned: **{detected_credits}**"
+                        )
+                    else:
+                        detection_info.info("🔄 Scanning for recyclable materials...")
+
+                    # 📊 Live Count Table
+                    df = pd.DataFrame(
+                        [["Cardboard", st.session_state.detection_count["Cardboard"]],
+                         ["Metal", st.session_state.detection_count["Metal"]],
+                         ["Paper", st.session_state.detection_count["Paper"]],
+                         ["Plastic", st.session_state.detection_count["Plastic"]]],
+                        columns=["Material", "Total Detected"]
                     )
-                else:
-                    detection_info.info("🔄 Scanning for recyclable materials...")
-
-                # 📊 Live Count Table
-                df = pd.DataFrame(
-                    [["Cardboard", st.session_state.detection_count["Cardboard"]],
-                     ["Metal", st.session_state.detection_count["Metal"]],
-                     ["Paper", st.session_state.detection_count["Paper"]],
-                     ["Plastic", st.session_state.detection_count["Plastic"]]],
-                    columns=["Material", "Total Detected"]
-                )
-                table_display.dataframe(df, use_container_width=True)
-
-            # ✅ Clean-up
-            cap.release()
-            cv2.destroyAllWindows()
+                    table_display.dataframe(df, use_container_width=True)
+                    probe.end_frame(slot.rgb.nbytes)
+                    if probe.enabled:
+                        alloc_info.caption(f"🧮 Full-frame copies allocated per frame over {probe.frames} frames — {probe.summary()}")
+            finally:
+                # ✅ Clean-up
+                probe.stop()
+                cap.release()
+                cv2.destroyAllWindows()
 
 if menu == "EcoPoints Redemption":
     if not st.session_state.accepted_terms:
         st.warning("⚠️ You must accept the terms to access this page!")
     else:
-        pass
-        # --- One-Time Reset Per App Launch ---
-        if "reset_done" not in st.session_state:
-            if os.path.exists("ai_avatar_app/user_data.json"):
-                os.remove("ai_avatar_app/user_data.json")
-            st.session_state.detection_history = pd.DataFrame(columns=["Timestamp", "Material", "Credits"])
-            st.session_state.reset_done = True
-    
-        # --- Load & Save User Data ---
-        def load_user_data():
-            if os.path.exists("ai_avatar_app/user_data.json"):
-                with open("ai_avatar_app/user_data.json", "r") as f:
-                    return json.load(f)
-            return {
-                "earned_points": 0,
-                "spent_points": 0,
-                "avatar": "",
-                "vouchers": []
-            }
-    
-        def save_user_data(data):
-            with open("ai_avatar_app/user_data.json", "w") as f:
-                json.dump(data, f, indent=4)
-    
-        user_data = load_user_data()
+        # --- Load User Data ---
+        user_path = user_data_path(st.session_state.username)
+        user_data = load_user_data(user_path)
         user_data.setdefault("spent_points", 0)
+
+        # --- PIN Check (spending EcoPoints needs the resident's PIN) ---
+        if st.session_state.get("unlocked_user") != st.session_state.username:
+            if not user_data.get("pin_hash"):
+                st.title("🔐 Set Your PIN")
+                st.markdown("Choose a 4–8 digit PIN. You'll need it to spend EcoPoints on this account.")
+                new_pin = st.text_input("New PIN", type="password", key="new_pin")
+                confirm_pin = st.text_input("Confirm PIN", type="password", key="confirm_pin")
+                if st.button("Save PIN"):
+                    if not (new_pin.isdigit() and 4 <= len(new_pin) <= 8):
+                        st.error("❌ PIN must be 4–8 digits.")
+                    elif new_pin != confirm_pin:
+                        st.error("❌ PINs do not match.")
+                    else:
+                        user_data["pin_hash"] = hash_pin(new_pin)
+                        save_user_data(user_data, user_path)
+                        st.session_state.unlocked_user = st.session_state.username
+                        st.rerun()
+            else:
+                st.title("🔐 Enter Your PIN")
+                pin = st.text_input("PIN", type="password", key="pin")
+                if st.button("Unlock"):
+                    if verify_pin(pin, user_data["pin_hash"]):
+                        st.session_state.unlocked_user = st.session_state.username
+                        st.rerun()
+                    else:
+                        st.error("❌ Incorrect PIN.")
+            st.stop()
     
         # --- Fallback Detection History ---
         if "detection_history" not in st.session_state:
-            st.session_state.detection_history = pd.DataFrame(columns=["Timestamp", "Material", "Credits"])
+            st.session_state.detection_history = new_detection_history()
     
         # --- Cooldown Timer for Real-Time Updates ---
         now = time.time()
@@ -407,10 +384,10 @@ if menu == "EcoPoints Redemption":
         
         # --- Recalculate Points if Cooldown Passed ---
         if now - last_update > cooldown_secs:
-            earned_points = int(st.session_state.detection_history["Credits"].sum())
+            earned_points = int(leaderboard.score(st.session_state.username))
             if earned_points != user_data.get("earned_points", 0):
                 user_data["earned_points"] = earned_points
-                save_user_data(user_data)
+                save_user_data(user_data, user_path)
             st.session_state["last_detection_time"] = now
         
         # --- Always Read Latest Earned Points From File ---
@@ -418,30 +395,6 @@ if menu == "EcoPoints Redemption":
         available_points = earned_points - user_data["spent_points"]
 
     
-        # --- Avatar Theme Definitions ---
-        avatar_themes = {
-            "water_spirit.png": {
-                "name": "Water Spirit 💧",
-                "color": "#0077cc",
-                "vouchers": ["Free Bubble Tea", "Hydration Bottle", "Iced Coconut"]
-            },
-            "metal_titan.png": {
-                "name": "Metal Titan ⚙️",
-                "color": "#555555",
-                "vouchers": ["Tool Kit Discount", "Screwdriver Set", "Gadget Wipes"]
-            },
-            "earth_guardian.png": {
-                "name": "Earth Guardian 🌱",
-                "color": "#228B22",
-                "vouchers": ["Plant Starter Kit", "Compost Bag", "Eco Fertilizer"]
-            },
-            "balance_seeker.png": {
-                "name": "Balance Seeker 🌈",
-                "color": "#9932CC",
-                "vouchers": ["Rainbow Pouch", "Yoga Pass", "Mood Candle"]
-            }
-        }
-    
         # --- First-Time Avatar Selection ---
         if not user_data["avatar"]:
             st.title("🎨 Choose Your Avatar")
@@ -450,11 +403,11 @@ if menu == "EcoPoints Redemption":
             selected = st.selectbox(
                 "Pick your avatar:",
                 avatar_files,
-                format_func=lambda x: avatar_themes[x]["name"]
+                format_func=lambda x: AVATAR_THEMES[x]["name"]
             )
             if st.button("Confirm Avatar"):
                 user_data["avatar"] = selected
-                save_user_data(user_data)
+                save_user_data(user_data, user_path)
                 st.rerun()
         else:
             voucher_redeemed = False
@@ -464,7 +417,7 @@ if menu == "EcoPoints Redemption":
             # --- Avatar Display Section ---
             st.markdown("### 👤 Your Avatar")
             avatar = user_data["avatar"]
-            avatar_data = avatar_themes.get(avatar, {})
+            avatar_data = AVATAR_THEMES.get(avatar, {})
             avatar_name = avatar_data.get("name", "")
             user_vouchers = avatar_data.get("vouchers", [])
             color = avatar_data.get("color", "#0077cc")
@@ -488,7 +441,7 @@ if menu == "EcoPoints Redemption":
                     new_avatar = st.selectbox(
                         "Choose a new avatar:",
                         avatar_files,
-                        format_func=lambda x: avatar_themes[x]["name"],
+                        format_func=lambda x: AVATAR_THEMES[x]["name"],
                         key="change_avatar"
                     )
                     if new_avatar == user_data["avatar"]:
@@ -496,8 +449,8 @@ if menu == "EcoPoints Redemption":
                     elif st.button("Confirm Avatar Change"):
                         user_data["avatar"] = new_avatar
                         user_data["spent_points"] += 200
-                        save_user_data(user_data)
-                        st.success(f"Avatar changed to {avatar_themes[new_avatar]['name']}!")
+                        save_user_data(user_data, user_path)
+                        st.success(f"Avatar changed to {AVATAR_THEMES[new_avatar]['name']}!")
                         time.sleep(2)
                         st.rerun()
     
@@ -514,10 +467,8 @@ if menu == "EcoPoints Redemption":
             st.markdown("### 🎁 Redeem Themed Vouchers")
             st.markdown("Unlock unique rewards themed around your eco-avatar! Each voucher costs **1,000 EcoPoints**.")
     
-            # Split vouchers into redeemed and unredeemed
-            redeemed = [v for v in user_vouchers if v in user_data["vouchers"]]
-            unredeemed = [v for v in user_vouchers if v not in user_data["vouchers"]]
-            display_order = unredeemed + redeemed  # Unredeemed on top
+            # Unredeemed vouchers on top
+            display_order = voucher_display_order(user_vouchers, user_data["vouchers"])
     
             for voucher in display_order:
                 redeemed_status = voucher in user_data["vouchers"]
@@ -553,17 +504,13 @@ if menu == "EcoPoints Redemption":
                                 user_data["vouchers"].append(voucher)
                                 user_data["spent_points"] += 1000
                                 available_points -= 1000
-                                save_user_data(user_data)
+                                save_user_data(user_data, user_path)
     
                                 st.success(f"🎉 Voucher Redeemed: {voucher}")
                                 code = "VCHR-" + str(random.randint(100000, 999999))
                                 st.code(code, language="text")
     
-                                img = Image.new('RGB', (300, 150), color='white')
-                                draw = ImageDraw.Draw(img)
-                                draw.rectangle([10, 10, 290, 140], outline=color, width=3)
-                                draw.text((30, 50), f"{voucher}", fill="black")
-                                draw.text((30, 90), f"Code: {code}", fill=color)
+                                img = build_voucher_image(voucher, code, color)
                                 st.image(img, caption="Show this at counter", use_column_width=False)
     
                                 st.balloons()
@@ -580,14 +527,41 @@ if menu == "EcoPoints Redemption":
             # --- Map Section ---
             st.markdown("### 🗺️ Find Nearby Recycling Points")
             st.info("Check out the nearest recycling bins to your location.")
-            map = folium.Map(location=[1.3521, 103.8198], zoom_start=11)
-            folium.Marker([1.355, 103.82], tooltip="Recycling Point - Block 123").add_to(map)
-            folium.Marker([1.35, 103.83], tooltip="Recycling Point - Green Mall").add_to(map)
-            st_folium(map, width=700, height=500)
+            st_folium(build_recycling_map(), width=700, height=500)
     
             st.markdown("💚 *Thank you for being an eco-hero!*")
     
             # --- Refresh view if redeemed ---
             if voucher_redeemed:
                 time.sleep(2)
-                st.rerun()
\ No newline at end of file
+                st.rerun()
+
+# ✅ Leaderboard Tab (Estate-Wide Rankings)
+if menu == "Leaderboard":
+    if not st.session_state.accepted_terms:
+        st.warning("⚠️ You must accept the terms to access this page!")
+    else:
+        st.header("🏆 Estate Leaderboard")
+        st.markdown("See how your recycling compares with other residents in the estate.")
+
+        col1, col2, col3 = st.columns(3)
+        period = col1.selectbox("📅 Period", leaderboard.periods())
+        material = col2.selectbox("♻️ Material", [ALL_MATERIALS] + MATERIALS)
+        top_n = col3.selectbox("🔝 Show Top", [10, 50, 100], index=2)
+
+        # 📊 Your Standing
+        your_rank = leaderboard.rank(st.session_state.username, period, material)
+        your_credits = leaderboard.score(st.session_state.username, period, material)
+        rank_col, credit_col = st.columns(2)
+        rank_col.metric("🥇 Your Rank", f"#{your_rank}" if your_rank else "Unranked")
+        credit_col.metric("🪙 Your Credits", f"{your_credits}")
+
+        st.divider()
+
+        # 📋 Top Residents
+        rows = leaderboard.top(top_n, period, material)
+        if rows:
+            board_df = pd.DataFrame(rows, columns=["Rank", "Resident", "Credits"])
+            st.dataframe(board_df, use_container_width=True, hide_index=True)
+        else:
+            st.info("🔄 No credited detections for this period yet.")
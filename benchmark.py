@@ -0,0 +1,318 @@
+"""
+EcoSortAI load generator & benchmark 📈
+
+Generates synthetic detection streams plus redemption / avatar-change traffic for many
+simulated users, and drives them through the same data paths the Streamlit tabs use
+(see `ecosort_core`). Prints one Markdown row per scale so results can be pasted into a
+benchmark table and compared between commits.
+
+    python benchmark.py --scales 1000 100000 1000000 --users 500
+"""
+import argparse, io, os, random, tempfile, time, tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+
+import cv2
+import matplotlib
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+
+from leaderboard import Leaderboard
+from frame_pool import FramePool, FrameAllocationProbe, legacy_read
+from ecosort_core import (
+    MATERIALS, CREDIT_MAPPING, HISTORY_COLUMNS, AVATAR_THEMES, record_detection, summarize_history,
+    format_history, build_overview_chart, build_tracking_chart, load_user_data, save_user_data,
+    voucher_display_order, build_voucher_image, build_recycling_map,
+)
+
+# Roughly how often each material shows up at a bin (cardboard & plastic dominate)
+MATERIAL_WEIGHTS = [0.35, 0.15, 0.2, 0.3]
+AVATARS = sorted(AVATAR_THEMES)
+
+
+# --- Synthetic Data ---
+def generate_history(rows, seed=0, start="2025-01-01"):
+    """Detection stream with bursty arrivals (several items per deposit, minutes to hours apart)."""
+    rng = np.random.default_rng(seed)
+    gaps = np.where(rng.random(rows) < 0.7, rng.integers(1, 5, rows), rng.integers(60, 7200, rows))
+    timestamps = pd.Timestamp(start) + pd.to_timedelta(np.cumsum(gaps), unit="s")
+    materials = rng.choice(MATERIALS, size=rows, p=MATERIAL_WEIGHTS)
+    credits = pd.Series(materials).map(CREDIT_MAPPING).to_numpy()
+    return pd.DataFrame({
+        "Timestamp": timestamps.strftime("%Y-%m-%d %H:%M:%S"),
+        "Material": materials,
+        "Credits": credits,
+    }, columns=HISTORY_COLUMNS)
+
+
+def counts_from_history(history):
+    counts = history["Material"].value_counts()
+    return {material: int(counts.get(material, 0)) for material in MATERIALS}
+
+
+# --- Measurement Helpers ---
+def measure(fn, make_args, repeats=3, trace=True):
+    """
+    Return (result, best seconds, peak traced bytes) for `fn(*make_args())`.
+
+    Memory comes from a separate untimed run under tracemalloc, and time from plain
+    `perf_counter` runs, so tracing overhead never shows up in the timings. `make_args` is
+    called outside both measured regions so every run gets fresh inputs.
+    """
+    peak = 0
+    if trace:
+        args = make_args()
+        tracemalloc.start()
+        fn(*args)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    best = float("inf")
+    for _ in range(repeats):
+        args = make_args()
+        start = time.perf_counter()
+        result = fn(*args)
+        best = min(best, time.perf_counter() - start)
+    return result, best, peak
+
+
+def render(fig):
+    # st.pyplot() rasterises the figure to PNG, so do the same here
+    buf = io.BytesIO()
+    fig.savefig(buf, format="png")
+    plt.close(fig)
+    return buf.tell()
+
+
+# --- Page Workloads ---
+def overview_page(detection_count):
+    # The Overview tab only reads the running `detection_count` dict, never the history
+    _, fig = build_overview_chart(detection_count, "May")
+    return render(fig)
+
+
+def waste_tracking_page(history):
+    # Like the tab, this normalises the session history in place
+    summarize_history(history)
+    fig = build_tracking_chart(history)
+    size = render(fig)
+    format_history(history)
+    return size
+
+
+def redemption_page(path, leaderboard, username):
+    """Points sync, voucher list, one voucher card and the recycling-point map."""
+    user_data = load_user_data(path)
+    user_data.setdefault("spent_points", 0)
+    earned_points = int(leaderboard.score(username))
+    if earned_points != user_data.get("earned_points", 0):
+        user_data["earned_points"] = earned_points
+        save_user_data(user_data, path)
+    theme = AVATAR_THEMES[user_data["avatar"]]
+    display_order = voucher_display_order(theme["vouchers"], user_data["vouchers"])
+    build_voucher_image(display_order[0], "VCHR-123456", theme["color"]).tobytes()
+    # st_folium() embeds the rendered map HTML
+    return len(build_recycling_map().get_root().render())
+
+
+def append_detections(history, count, seed=0):
+    rng = random.Random(seed)
+    timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
+    for _ in range(count):
+        history, _ = record_detection(history, rng.choices(MATERIALS, MATERIAL_WEIGHTS)[0], timestamp)
+    return history
+
+
+def simulate_user(user_id, data_dir, leaderboard, ops, seed):
+    """Redemption-page traffic for one user: credit detections, change avatar, redeem vouchers."""
+    rng = random.Random(seed + user_id)
+    path = os.path.join(data_dir, f"user_{user_id}.json")
+    save_user_data({"earned_points": 0, "spent_points": 0, "avatar": rng.choice(AVATARS), "vouchers": []}, path)
+
+    done = 0
+    for _ in range(ops):
+        user_data = load_user_data(path)
+        user_data.setdefault("spent_points", 0)
+        roll = rng.random()
+        if roll < 0.6:
+            material = rng.choices(MATERIALS, MATERIAL_WEIGHTS)[0]
+            leaderboard.credit(f"user_{user_id}", material, CREDIT_MAPPING[material], time.strftime("%Y-%m-%d %H:%M:%S"))
+            user_data["earned_points"] = leaderboard.score(f"user_{user_id}")
+        elif roll < 0.8:
+            user_data["avatar"] = rng.choice([a for a in AVATARS if a != user_data["avatar"]])
+            user_data["spent_points"] += 200
+        else:
+            unredeemed = [v for v in AVATAR_THEMES[user_data["avatar"]]["vouchers"] if v not in user_data["vouchers"]]
+            if unredeemed:
+                user_data["vouchers"].append(rng.choice(unredeemed))
+                user_data["spent_points"] += 1000
+        save_user_data(user_data, path)
+        done += 1
+    return done
+
+
+def redemption_traffic(users, ops, seed):
+    with tempfile.TemporaryDirectory() as data_dir:
+        leaderboard = Leaderboard(os.path.join(data_dir, "leaderboard.json"), os.path.join(data_dir, "journal.jsonl"))
+        with ThreadPoolExecutor(max_workers=users) as pool:
+            total = sum(pool.map(lambda uid: simulate_user(uid, data_dir, leaderboard, ops, seed), range(users)))
+        leaderboard.top(100)
+        leaderboard.close()
+        return total
+
+
+# --- Frame Pipeline ---
+class SyntheticCapture:
+    """Stands in for cv2.VideoCapture: honours `read(image)` the way OpenCV does."""
+
+    def __init__(self, shape, seed=0):
+        self.frame = np.random.default_rng(seed).integers(0, 256, shape, dtype=np.uint8)
+
+    def read(self, image=None):
+        if image is not None and image.shape == self.frame.shape:
+            np.copyto(image, self.frame)
+            return True, image
+        return True, self.frame.copy()
+
+
+def frame_pipeline(path, frames, shape, model=None):
+    """Per-step full-frame copies for the baseline (`legacy`) or `pooled` recognition loop."""
+    cap = SyntheticCapture(shape)
+    pool = FramePool(shape)
+    probe = FrameAllocationProbe()
+    probe.start()
+    try:
+        for _ in range(frames):
+            with probe.step("capture"):
+                if path == "pooled":
+                    _, slot = pool.read(cap)
+                    rgb = slot.rgb
+                else:
+                    _, rgb = legacy_read(cap)
+            if model is not None:
+                with probe.step("model"):
+                    model(rgb, conf=0.8, iou=0.7, classes=[0, 1, 2, 3], verbose=False)
+            with probe.step("snapshot"):
+                # Same conversion as cv2.imwrite, without touching the disk
+                cv2.imencode(".jpg", slot.bgr if path == "pooled" else cv2.cvtColor(rgb, cv2.COLOR_RGB2BGR))
+            probe.end_frame(rgb.nbytes)
+    finally:
+        probe.stop()
+    return probe.frame_copies_per_frame()
+
+
+def frame_table(args):
+    model = None
+    if args.weights:
+        from ultralytics import YOLO
+        model = YOLO(args.weights)
+    shape = (args.frame_height, args.frame_width, 3)
+    results = {path: frame_pipeline(path, args.frames, shape, model) for path in ("legacy", "pooled")}
+    steps = list(results["legacy"])
+    lines = [
+        f"| path ({args.frame_width}x{args.frame_height}, {args.frames} frames) | "
+        + " | ".join(f"{step} copies/frame" for step in steps) + " |",
+        "|---|" + "---:|" * len(steps),
+    ]
+    for path, copies in results.items():
+        lines.append(f"| {path} | " + " | ".join(f"{copies.get(step, 0):.2f}" for step in steps) + " |")
+    return lines
+
+
+# --- Benchmark Table ---
+def run_scale(rows, args, data_dir):
+    history = generate_history(rows, seed=args.seed)
+    history_mb = history.memory_usage(deep=True).sum() / 1e6
+    detection_count = counts_from_history(history)
+
+    # Redemption page state: one resident credited with everything in this history
+    leaderboard = Leaderboard(os.path.join(data_dir, f"leaderboard_{rows}.json"),
+                              os.path.join(data_dir, f"journal_{rows}.jsonl"))
+    for material, count in detection_count.items():
+        leaderboard.board().add("resident", CREDIT_MAPPING[material] * count)
+    user_path = os.path.join(data_dir, f"resident_{rows}.json")
+    save_user_data({"earned_points": 0, "spent_points": 0, "avatar": AVATARS[0], "vouchers": []}, user_path)
+
+    _, overview_s, overview_peak = measure(overview_page, lambda: (detection_count,), args.repeats)
+    _, tracking_s, tracking_peak = measure(
+        waste_tracking_page, lambda: (generate_history(rows, seed=args.seed),), args.repeats
+    )
+    _, redemption_s, redemption_peak = measure(
+        redemption_page, lambda: (user_path, leaderboard, "resident"), args.repeats
+    )
+    _, append_s, _ = measure(append_detections, lambda: (history, args.appends, args.seed), 1, trace=False)
+    total_ops, traffic_s, traffic_peak = measure(
+        redemption_traffic, lambda: (args.users, args.ops, args.seed), 1
+    )
+
+    return {
+        "rows": rows,
+        "history_mb": history_mb,
+        "overview_ms": overview_s * 1000,
+        "overview_peak_mb": overview_peak / 1e6,
+        "tracking_ms": tracking_s * 1000,
+        "tracking_peak_mb": tracking_peak / 1e6,
+        "redemption_ms": redemption_s * 1000,
+        "redemption_peak_mb": redemption_peak / 1e6,
+        "detections_per_s": args.appends / append_s,
+        "traffic_ops_per_s": total_ops / traffic_s,
+        "traffic_peak_mb": traffic_peak / 1e6,
+    }
+
+
+def format_row(result):
+    return (
+        f"| {result['rows']:>9,} | {result['history_mb']:>8.1f} "
+        f"| {result['overview_ms']:>9.1f} | {result['overview_peak_mb']:>8.1f} "
+        f"| {result['tracking_ms']:>9.1f} | {result['tracking_peak_mb']:>8.1f} "
+        f"| {result['redemption_ms']:>9.1f} | {result['redemption_peak_mb']:>8.1f} "
+        f"| {result['detections_per_s']:>9.0f} | {result['traffic_ops_per_s']:>9.0f} | {result['traffic_peak_mb']:>8.1f} |"
+    )
+
+
+TABLE_HEADER = (
+    "| rows | history MB | overview ms | overview MB | tracking ms | tracking MB "
+    "| redemption ms | redemption MB | detections/s | traffic ops/s | traffic MB |\n"
+    "|---:|---:|---:|---:|---:|---:|---:|---:|---:|---:|---:|"
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load-test the EcoSortAI dashboard and redemption data paths.")
+    parser.add_argument("--scales", type=int, nargs="+", default=[1_000, 10_000, 100_000, 1_000_000],
+                        help="detection-history sizes to benchmark")
+    parser.add_argument("--users", type=int, default=500, help="concurrent simulated redemption users")
+    parser.add_argument("--ops", type=int, default=20, help="redemption / avatar-change operations per user")
+    parser.add_argument("--appends", type=int, default=200, help="live detections appended per scale")
+    parser.add_argument("--repeats", type=int, default=3, help="timed runs per page (best is reported)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--frames", type=int, default=0,
+                        help="also compare per-frame allocations of the legacy and pooled recognition loop")
+    parser.add_argument("--frame-width", type=int, default=1280)
+    parser.add_argument("--frame-height", type=int, default=720)
+    parser.add_argument("--weights", help="YOLO weights to include the model step in the frame comparison")
+    parser.add_argument("--output", help="also append the table to this Markdown file")
+    args = parser.parse_args()
+
+    lines = [TABLE_HEADER]
+    print(TABLE_HEADER, flush=True)
+    with tempfile.TemporaryDirectory() as data_dir:
+        for rows in args.scales:
+            line = format_row(run_scale(rows, args, data_dir))
+            lines.append(line)
+            print(line, flush=True)
+
+    if args.frames:
+        frame_lines = frame_table(args)
+        print("\n" + "\n".join(frame_lines), flush=True)
+        lines += [""] + frame_lines
+
+    if args.output:
+        with open(args.output, "a") as f:
+            f.write(f"\n<!-- {time.strftime('%Y-%m-%d %H:%M:%S')} users={args.users} ops={args.ops} -->\n")
+            f.write("\n".join(lines) + "\n")
+
+
+if __name__ == "__main__":
+    main()
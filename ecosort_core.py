@@ -0,0 +1,196 @@
+import os, re, hmac, json, hashlib
+import pandas as pd
+import matplotlib.pyplot as plt
+import folium
+from PIL import Image, ImageDraw
+
+# ♻️ Shared data paths for the Streamlit tabs (kept free of `st` so scripts can import them)
+
+MATERIALS = ["Cardboard", "Metal", "Paper", "Plastic"]
+HISTORY_COLUMNS = ["Timestamp", "Material", "Credits"]
+CREDIT_MAPPING = {"Cardboard": 7, "Metal": 10, "Paper": 5, "Plastic": 6}
+MATERIAL_COLORS = {"Cardboard": "#66bb6a", "Metal": "#fdd835", "Paper": "#ef5350", "Plastic": "#42a5f5"}
+USERS_DIR = "ai_avatar_app/users"
+DEFAULT_USER = "guest"
+
+AVATAR_THEMES = {
+    "water_spirit.png": {
+        "name": "Water Spirit 💧",
+        "color": "#0077cc",
+        "vouchers": ["Free Bubble Tea", "Hydration Bottle", "Iced Coconut"]
+    },
+    "metal_titan.png": {
+        "name": "Metal Titan ⚙️",
+        "color": "#555555",
+        "vouchers": ["Tool Kit Discount", "Screwdriver Set", "Gadget Wipes"]
+    },
+    "earth_guardian.png": {
+        "name": "Earth Guardian 🌱",
+        "color": "#228B22",
+        "vouchers": ["Plant Starter Kit", "Compost Bag", "Eco Fertilizer"]
+    },
+    "balance_seeker.png": {
+        "name": "Balance Seeker 🌈",
+        "color": "#9932CC",
+        "vouchers": ["Rainbow Pouch", "Yoga Pass", "Mood Candle"]
+    }
+}
+
+
+# --- Detection History ---
+def new_detection_count():
+    return {material: 0 for material in MATERIALS}
+
+
+def new_detection_history():
+    return pd.DataFrame(columns=HISTORY_COLUMNS)
+
+
+def record_detection(history, material_name, timestamp):
+    """Append one credited detection and return the new history frame."""
+    credits = CREDIT_MAPPING.get(material_name, 0)
+    new_entry = pd.DataFrame([[timestamp, material_name, credits]], columns=HISTORY_COLUMNS)
+    return pd.concat([history, new_entry], ignore_index=True), credits
+
+
+def summarize_history(history):
+    if history.empty:
+        return 0, 0, 0
+    return history["Credits"].sum(), len(history), history["Material"].nunique()
+
+
+def format_history(history):
+    """Normalise timestamps in place and return the Date/Time table shown in Waste Tracking."""
+    if history.empty:
+        return pd.DataFrame(columns=["Date", "Time", "Material", "Credits"])
+    history["Timestamp"] = pd.to_datetime(history["Timestamp"], errors="coerce")
+    history.dropna(subset=["Timestamp"], inplace=True)
+    history["Date"] = history["Timestamp"].dt.date
+    history["Time"] = history["Timestamp"].dt.time
+    return history[["Date", "Time", "Material", "Credits"]]
+
+
+# --- Model ---
+def detect_material(model, image):
+    """Label of the first box YOLO returns for `image` (array or path), or "unknown"."""
+    results = model(image, verbose=False)[0]
+    if results.names and results.boxes:
+        class_id = int(results.boxes.cls[0])
+        return results.names[class_id]
+    return "unknown"
+
+
+# --- Charts ---
+def build_overview_chart(detection_count, selected_month):
+    df = pd.DataFrame(list(detection_count.items()), columns=["Material", "Count"])
+
+    fig, ax = plt.subplots(figsize=(8, 5))
+    bars = ax.bar(df["Material"], df["Count"], color=[MATERIAL_COLORS.get(m, "#9e9e9e") for m in df["Material"]])
+
+    ax.set_ylabel("🔢 Detection Count", fontsize=12)
+    ax.set_title(f"📦 Detected Materials in {selected_month}", fontsize=14)
+    ax.set_facecolor("#f9f9f9")
+    fig.patch.set_facecolor("#f9f9f9")
+
+    for bar in bars:
+        height = bar.get_height()
+        ax.annotate(f'{height}', xy=(bar.get_x() + bar.get_width() / 2, height),
+                    xytext=(0, 3), textcoords="offset points", ha='center', fontsize=10)
+    return df, fig
+
+
+def build_tracking_chart(history, materials=MATERIALS):
+    fig, ax = plt.subplots(figsize=(8, 5))
+
+    for material in materials:
+        material_data = history[history["Material"] == material]
+        if not material_data.empty:
+            ax.plot(
+                material_data.index,
+                material_data["Credits"].cumsum(),
+                label=material,
+                linewidth=2,
+                color=MATERIAL_COLORS.get(material, "#9e9e9e"),
+            )
+
+    ax.set_ylabel("Total Credits", fontsize=12)
+    ax.set_xlabel("Detection Event Index", fontsize=12)
+    ax.set_title("📊 Credit Accumulation by Material", fontsize=14)
+    ax.legend(loc="upper left")
+    ax.grid(True, linestyle="--", alpha=0.3)
+    fig.patch.set_facecolor("#f9f9f9")
+    ax.set_facecolor("#f9f9f9")
+    return fig
+
+
+# --- EcoPoints Redemption ---
+def voucher_display_order(avatar_vouchers, redeemed_vouchers):
+    """Unredeemed vouchers on top, redeemed ones after."""
+    redeemed = [v for v in avatar_vouchers if v in redeemed_vouchers]
+    unredeemed = [v for v in avatar_vouchers if v not in redeemed_vouchers]
+    return unredeemed + redeemed
+
+
+def build_voucher_image(voucher, code, color):
+    img = Image.new('RGB', (300, 150), color='white')
+    draw = ImageDraw.Draw(img)
+    draw.rectangle([10, 10, 290, 140], outline=color, width=3)
+    draw.text((30, 50), f"{voucher}", fill="black")
+    draw.text((30, 90), f"Code: {code}", fill=color)
+    return img
+
+
+def build_recycling_map():
+    recycling_map = folium.Map(location=[1.3521, 103.8198], zoom_start=11)
+    folium.Marker([1.355, 103.82], tooltip="Recycling Point - Block 123").add_to(recycling_map)
+    folium.Marker([1.35, 103.83], tooltip="Recycling Point - Green Mall").add_to(recycling_map)
+    return recycling_map
+
+
+# --- Accounts ---
+def sanitize_username(username):
+    """
+    Usernames double as file names and leaderboard keys, so keep them to lower-case letters,
+    digits, '-' and '_' ("Alice" and "alice" must be the same resident on case-insensitive
+    file systems).
+    """
+    username = re.sub(r"[^a-z0-9_-]", "", (username or "").strip().lower())[:32]
+    return username or DEFAULT_USER
+
+
+def user_data_path(username=DEFAULT_USER):
+    return os.path.join(USERS_DIR, f"{sanitize_username(username)}.json")
+
+
+# --- Account PIN ---
+def hash_pin(pin, salt=None):
+    """Salted PBKDF2 hash stored in the user file as "salt$digest"."""
+    salt = salt or os.urandom(16).hex()
+    digest = hashlib.pbkdf2_hmac("sha256", pin.encode(), bytes.fromhex(salt), 100_000).hex()
+    return f"{salt}${digest}"
+
+
+def verify_pin(pin, pin_hash):
+    salt = pin_hash.split("$", 1)[0]
+    return hmac.compare_digest(hash_pin(pin, salt), pin_hash)
+
+
+# --- Load & Save User Data ---
+def load_user_data(path=None):
+    path = path or user_data_path()
+    if os.path.exists(path):
+        with open(path, "r") as f:
+            return json.load(f)
+    return {
+        "earned_points": 0,
+        "spent_points": 0,
+        "avatar": "",
+        "vouchers": []
+    }
+
+
+def save_user_data(data, path=None):
+    path = path or user_data_path()
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(data, f, indent=4)
@@ -0,0 +1,203 @@
+"""
+EcoSortAI model evaluation over the Eco Gallery dataset 🧪
+
+Scores a YOLO weights file against the user-corrected images in eco_gallery_dataset/<label>/.
+Predictions are cached by (image hash, weights hash), so re-running after new photos are
+submitted, or after retraining, only runs inference on images that have no prediction yet for
+those weights. Inference is spread over worker processes.
+
+    python evaluate.py                                   # score train33/weights/best.pt
+    python evaluate.py --compare old_best.pt             # also diff precision/recall against old weights
+"""
+import argparse, hashlib, json, os, time
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+from ecosort_core import detect_material
+
+DATASET_DIR = "eco_gallery_dataset"
+WEIGHTS_PATH = "train33/weights/best.pt"
+CACHE_PATH = "eval_cache/predictions.json"
+IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png")
+# Each worker holds its own model copy, so stay well below the core count by default
+DEFAULT_WORKERS = max(1, min(4, (os.cpu_count() or 2) // 2))
+
+
+# --- Hashing & Cache ---
+def file_hash(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def load_cache(path=CACHE_PATH):
+    """{"files": {path: [size, mtime, image_hash]}, "predictions": {weights_hash: {image_hash: label}}}"""
+    if os.path.exists(path):
+        with open(path, "r") as f:
+            return json.load(f)
+    return {"files": {}, "predictions": {}}
+
+
+def save_cache(cache, path=CACHE_PATH):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(cache, f)
+    os.replace(tmp_path, path)
+
+
+# --- Dataset ---
+def scan_dataset(dataset_dir, cache):
+    """
+    Return [(path, true_label, image_hash)] for every image under dataset_dir/<label>/.
+    Only files whose size or mtime changed since the last run are re-hashed. A missing
+    dataset directory yields no images (and leaves the cache untouched).
+    """
+    if not os.path.isdir(dataset_dir):
+        return []
+    files = {}
+    images = []
+    for label in sorted(os.listdir(dataset_dir)):
+        label_dir = os.path.join(dataset_dir, label)
+        if not os.path.isdir(label_dir):
+            continue
+        for name in sorted(os.listdir(label_dir)):
+            if not name.lower().endswith(IMAGE_EXTENSIONS):
+                continue
+            path = os.path.join(label_dir, name)
+            stat = os.stat(path)
+            cached = cache["files"].get(path)
+            if cached and cached[0] == stat.st_size and cached[1] == stat.st_mtime:
+                image_hash = cached[2]
+            else:
+                image_hash = file_hash(path)
+            files[path] = [stat.st_size, stat.st_mtime, image_hash]
+            images.append((path, label.lower(), image_hash))
+    cache["files"] = files  # drop entries for deleted images
+    return images
+
+
+# --- Parallel Inference ---
+_worker_model = None
+
+
+def _init_worker(weights_path, threads):
+    global _worker_model
+    import torch
+    from ultralytics import YOLO
+    # torch defaults to one intra-op thread per core in *every* process; N workers would
+    # then oversubscribe the CPU N times over
+    torch.set_num_threads(threads)
+    _worker_model = YOLO(weights_path)
+
+
+def _predict(path):
+    return detect_material(_worker_model, path).lower()
+
+
+def predict_missing(images, weights_path, weights_hash, cache, workers, threads):
+    """Run inference only for images with no cached prediction under these weights."""
+    predictions = cache["predictions"].setdefault(weights_hash, {})
+    pending = {}
+    for path, _, image_hash in images:
+        if image_hash not in predictions:
+            pending.setdefault(image_hash, path)  # identical images are scored once
+
+    if pending:
+        hashes = list(pending)
+        workers = max(1, min(workers, len(hashes)))
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(weights_path, threads)) as pool:
+            labels = pool.map(_predict, [pending[h] for h in hashes], chunksize=max(1, len(hashes) // (workers * 4)))
+            for image_hash, label in zip(hashes, labels):
+                predictions[image_hash] = label
+    return predictions, len(pending)
+
+
+# --- Metrics ---
+def confusion_matrix(images, predictions):
+    df = pd.DataFrame(
+        [(label, predictions[image_hash]) for _, label, image_hash in images],
+        columns=["Actual", "Predicted"],
+    )
+    return pd.crosstab(df["Actual"], df["Predicted"])
+
+
+def precision_recall(matrix):
+    classes = sorted((set(matrix.index) | set(matrix.columns)) - {"unknown"})
+    rows = []
+    for cls in classes:
+        true_positive = matrix.loc[cls, cls] if cls in matrix.index and cls in matrix.columns else 0
+        predicted = matrix[cls].sum() if cls in matrix.columns else 0
+        actual = matrix.loc[cls].sum() if cls in matrix.index else 0
+        rows.append({
+            "Class": cls,
+            "Support": int(actual),
+            "Precision": true_positive / predicted if predicted else 0.0,
+            "Recall": true_positive / actual if actual else 0.0,
+        })
+    return pd.DataFrame(rows).set_index("Class")
+
+
+def evaluate(weights_path, images, cache, workers, threads):
+    weights_hash = file_hash(weights_path)
+    start = time.perf_counter()
+    predictions, scored = predict_missing(images, weights_path, weights_hash, cache, workers, threads)
+    elapsed = time.perf_counter() - start
+    print(f"🧪 {weights_path} ({weights_hash[:12]}): scored {scored} new/changed of {len(images)} images "
+          f"in {elapsed:.1f}s")
+    return confusion_matrix(images, predictions)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Evaluate YOLO weights on the Eco Gallery dataset.")
+    parser.add_argument("--weights", default=WEIGHTS_PATH, help="weights to evaluate")
+    parser.add_argument("--compare", help="baseline weights to diff precision/recall against")
+    parser.add_argument("--dataset", default=DATASET_DIR)
+    parser.add_argument("--cache", default=CACHE_PATH)
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS,
+                        help="inference worker processes, each loading its own model (default: %(default)s)")
+    parser.add_argument("--threads", type=int, default=1,
+                        help="torch threads per worker; keep workers x threads at or below the core count")
+    args = parser.parse_args()
+
+    cache = load_cache(args.cache)
+    images = scan_dataset(args.dataset, cache)
+    if not images:
+        print(f"❌ No labelled images found under {args.dataset}/<label>/")
+        save_cache(cache, args.cache)
+        return
+
+    try:
+        matrix = evaluate(args.weights, images, cache, args.workers, args.threads)
+        baseline_matrix = (
+            evaluate(args.compare, images, cache, args.workers, args.threads) if args.compare else None
+        )
+    finally:
+        save_cache(cache, args.cache)
+
+    print("\n📊 Confusion Matrix (rows: actual, columns: predicted)")
+    print(matrix.to_string())
+
+    metrics = precision_recall(matrix)
+    print("\n🎯 Precision / Recall")
+    print(metrics.to_string(float_format="{:.3f}".format))
+
+    if baseline_matrix is not None:
+        baseline = precision_recall(baseline_matrix)
+        diff = metrics[["Precision", "Recall"]].join(
+            baseline[["Precision", "Recall"]], how="outer", rsuffix=" (baseline)"
+        ).fillna(0.0)
+        diff["ΔPrecision"] = diff["Precision"] - diff["Precision (baseline)"]
+        diff["ΔRecall"] = diff["Recall"] - diff["Recall (baseline)"]
+        print(f"\n🔁 Diff vs {args.compare}")
+        print(diff.to_string(
+            float_format="{:.3f}".format,
+            formatters={"ΔPrecision": "{:+.3f}".format, "ΔRecall": "{:+.3f}".format},
+        ))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+
+import cv2
+import numpy as np
+
+# 🎞️ Recycled frame buffers for the Materials Recognition loop
+
+
+class FrameSlot:
+    """One set of preallocated buffers: raw camera BGR, mirrored BGR and mirrored RGB."""
+
+    def __init__(self, shape):
+        self.raw = np.empty(shape, dtype=np.uint8)
+        self.bgr = np.empty(shape, dtype=np.uint8)
+        self.rgb = np.empty(shape, dtype=np.uint8)
+
+
+class FramePool:
+    """
+    Ring of `size` FrameSlots reused across frames. Each frame is read straight into a slot,
+    mirrored with `cv2.flip(dst=)` and converted with `cv2.cvtColor(dst=)`, so the steady state
+    allocates no new full-frame arrays. Snapshots should write `slot.bgr` directly (it is the
+    mirrored frame in OpenCV's native order) instead of converting the RGB frame back.
+
+    Keep `size` above the number of frames a consumer may still hold on to (2 is enough when
+    the display and `cv2.imwrite` finish within the iteration).
+    """
+
+    def __init__(self, shape, size=2):
+        self.shape = tuple(shape)
+        self.slots = [FrameSlot(self.shape) for _ in range(size)]
+        self.index = 0
+
+    def read(self, cap):
+        """Grab the next frame into a recycled slot. Returns (ret, slot)."""
+        slot = self.slots[self.index]
+        self.index = (self.index + 1) % len(self.slots)
+
+        ret, frame = cap.read(slot.raw)
+        if not ret:
+            return False, slot
+        if frame is not slot.raw:
+            # Camera delivered a different resolution than requested: adopt it and resize the slot
+            slot.raw = frame
+            if frame.shape != slot.bgr.shape:
+                slot.bgr = np.empty_like(frame)
+                slot.rgb = np.empty_like(frame)
+
+        cv2.flip(slot.raw, 1, dst=slot.bgr)
+        cv2.cvtColor(slot.bgr, cv2.COLOR_BGR2RGB, dst=slot.rgb)
+        return True, slot
+
+
+def legacy_read(cap):
+    """The pre-pool capture path (fresh arrays every frame), kept as the comparison baseline."""
+    ret, frame = cap.read()
+    if not ret:
+        return False, None
+    frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+    frame = cv2.flip(frame, 1)
+    return True, frame
+
+
+class FrameAllocationProbe:
+    """
+    Measures how much memory each step of a loop iteration allocates, using tracemalloc.
+
+    Every `step()` resets the traced peak and records how far it rose above the memory in use
+    when the step began, so a full-frame copy shows up as roughly one frame's bytes even if
+    it is freed before the step ends. `end_frame()` takes the size of the frame actually
+    delivered, so the ratios stay right if the camera ignores the requested resolution.
+
+    NumPy and OpenCV arrays are traced; torch tensors and PIL's internal buffers use their own
+    allocators and are not. Tracing slows the loop, so the probe is opt-in (`enabled=False`
+    turns every step into a no-op). `stop()` only stops tracing this probe started itself.
+    """
+
+    def __init__(self, enabled=True):
+        self.enabled = enabled
+        self.totals = {}
+        self.frames = 0
+        self.frame_bytes = 0
+        self._started = False
+
+    def start(self):
+        if self.enabled and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started = True
+
+    def stop(self):
+        if self._started:
+            tracemalloc.stop()
+            self._started = False
+
+    def step(self, name):
+        if not self.enabled:
+            return nullcontext()
+        return self._traced_step(name)
+
+    @contextmanager
+    def _traced_step(self, name):
+        tracemalloc.reset_peak()
+        base = tracemalloc.get_traced_memory()[0]
+        try:
+            yield
+        finally:
+            peak = tracemalloc.get_traced_memory()[1]
+            self.totals[name] = self.totals.get(name, 0) + max(0, peak - base)
+
+    def end_frame(self, frame_nbytes):
+        self.frames += 1
+        self.frame_bytes += frame_nbytes
+
+    def frame_copies_per_frame(self):
+        """{step: average full-frame equivalents allocated per frame}, plus a "total" entry."""
+        if not self.frame_bytes:
+            return {}
+        copies = {name: total / self.frame_bytes for name, total in self.totals.items()}
+        copies["total"] = sum(copies.values())
+        return copies
+
+    def summary(self):
+        return " | ".join(f"{name}: {copies:.2f}" for name, copies in self.frame_copies_per_frame().items())
@@ -0,0 +1,209 @@
+import os, json, bisect, queue, atexit, threading
+
+# 🏆 Cross-user EcoPoints leaderboard, maintained incrementally as detections are credited
+
+ALL_TIME = "All Time"
+ALL_MATERIALS = "All"
+LEADERBOARD_PATH = "ai_avatar_app/leaderboard.json"
+JOURNAL_PATH = "ai_avatar_app/leaderboard_journal.jsonl"
+
+
+class RankIndex:
+    """
+    Credits per user for one (period, material) board. `order` is kept sorted as
+    (-credits, username), so top-k is a slice and a user's rank is a bisect.
+    """
+
+    def __init__(self):
+        self.scores = {}
+        self.order = []
+
+    def add(self, username, credits):
+        old = self.scores.get(username)
+        if old is not None:
+            del self.order[bisect.bisect_left(self.order, (-old, username))]
+        new = (old or 0) + credits
+        self.scores[username] = new
+        bisect.insort(self.order, (-new, username))
+
+    def rank(self, username):
+        """1-based rank (ties share a rank), or None if the user has no credits here."""
+        if username not in self.scores:
+            return None
+        return bisect.bisect_left(self.order, (-self.scores[username],)) + 1
+
+    def top(self, k):
+        rows = []
+        for position, (neg_score, username) in enumerate(self.order[:k]):
+            if rows and rows[-1][2] == -neg_score:
+                rank = rows[-1][0]
+            else:
+                rank = position + 1
+            rows.append((rank, username, -neg_score))
+        return rows
+
+
+class Leaderboard:
+    """
+    One RankIndex per (period, material), where period is ALL_TIME or a "YYYY-MM" month and
+    material is ALL_MATERIALS or a single material. Each credit touches four boards.
+
+    `credit()` only updates memory and queues a journal line; a background writer keeps the
+    JSONL journal open, writes queued lines in batches and compacts the journal into the
+    snapshot every `compact_every` entries. Every entry carries a sequence number and the
+    snapshot records the last one it contains, so replaying on load is idempotent whatever
+    point a crash interrupted compaction at.
+    """
+
+    def __init__(self, path=LEADERBOARD_PATH, journal_path=JOURNAL_PATH, compact_every=10_000):
+        self.path = path
+        self.journal_path = journal_path
+        self.compact_every = compact_every
+        self.boards = {}
+        self.seq = 0
+        self.lock = threading.Lock()
+        self._writer_lock = threading.Lock()  # one writer at a time; held while starting or closing one
+        self._queue = None
+        self._writer = None
+        self._atexit_registered = False
+
+    @classmethod
+    def load(cls, path=LEADERBOARD_PATH, journal_path=JOURNAL_PATH, compact_every=10_000):
+        leaderboard = cls(path, journal_path, compact_every)
+        snapshot_seq = 0
+        if os.path.exists(path):
+            with open(path, "r") as f:
+                snapshot = json.load(f)
+            snapshot_seq = snapshot["seq"]
+            for period, materials in snapshot["boards"].items():
+                for material, scores in materials.items():
+                    board = leaderboard.board(period, material)
+                    for username, credits in scores.items():
+                        board.add(username, credits)
+        leaderboard.seq = snapshot_seq
+
+        # A rotated journal is only left behind if a compaction was interrupted
+        journals = [p for p in (journal_path + ".old", journal_path) if os.path.exists(p)]
+        for journal in journals:
+            with open(journal, "r") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue  # blank or torn last line
+                    if entry["seq"] > snapshot_seq:
+                        leaderboard._apply(entry["user"], entry["material"], entry["credits"], entry["timestamp"])
+                        leaderboard.seq = max(leaderboard.seq, entry["seq"])
+        if journals:
+            leaderboard._compact(rotate=False)
+        return leaderboard
+
+    def board(self, period=ALL_TIME, material=ALL_MATERIALS):
+        return self.boards.setdefault((period, material), RankIndex())
+
+    def _apply(self, username, material, credits, timestamp):
+        month = str(timestamp)[:7]
+        for period in (ALL_TIME, month):
+            for board_material in (ALL_MATERIALS, material):
+                self.board(period, board_material).add(username, credits)
+
+    def credit(self, username, material, credits, timestamp):
+        """Record one credited detection (timestamp formatted as "%Y-%m-%d %H:%M:%S")."""
+        with self.lock:
+            self._apply(username, material, credits, timestamp)
+            self.seq += 1
+            line = json.dumps({"seq": self.seq, "user": username, "material": material,
+                               "credits": credits, "timestamp": timestamp}) + "\n"
+            if self._writer is not None:
+                self._queue.put(line)
+                return
+
+        # No writer running (first credit, or after close()): start one, waiting for any
+        # close() still flushing the previous writer
+        with self._writer_lock:
+            with self.lock:
+                if self._writer is None:
+                    self._queue = queue.Queue()
+                    self._writer = threading.Thread(target=self._write_journal, args=(self._queue,), daemon=True)
+                    self._writer.start()
+                    if not self._atexit_registered:
+                        atexit.register(self.close)
+                        self._atexit_registered = True
+                self._queue.put(line)
+
+    def close(self):
+        """Flush queued journal lines and stop the writer thread. A later credit() starts a new one."""
+        with self._writer_lock:
+            with self.lock:
+                writer, journal_queue = self._writer, self._queue
+                self._writer = None
+            if writer is not None:
+                journal_queue.put(None)
+                writer.join()
+
+    # --- Background Journal Writer ---
+    def _write_journal(self, journal_queue):
+        os.makedirs(os.path.dirname(self.journal_path) or ".", exist_ok=True)
+        journal = open(self.journal_path, "a")
+        written = 0
+        try:
+            while True:
+                lines = [journal_queue.get()]
+                while True:
+                    try:
+                        lines.append(journal_queue.get_nowait())
+                    except queue.Empty:
+                        break
+                stop = None in lines
+                journal.writelines(line for line in lines if line is not None)
+                journal.flush()
+                written += len(lines) - stop
+                if stop:
+                    return
+                if written >= self.compact_every:
+                    journal.close()
+                    self._compact(rotate=True)
+                    journal = open(self.journal_path, "a")
+                    written = 0
+        finally:
+            journal.close()
+
+    def _compact(self, rotate):
+        """
+        Atomically replace the snapshot with the current boards, then drop the journal.
+        With `rotate`, the journal is first moved aside so new lines go to a fresh file.
+        """
+        if rotate:
+            os.replace(self.journal_path, self.journal_path + ".old")
+        with self.lock:
+            snapshot = {"seq": self.seq, "boards": {}}
+            for (period, material), board in self.boards.items():
+                snapshot["boards"].setdefault(period, {})[material] = dict(board.scores)
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(snapshot, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+        if os.path.exists(self.journal_path + ".old"):
+            os.remove(self.journal_path + ".old")
+        if not rotate and os.path.exists(self.journal_path):
+            os.remove(self.journal_path)
+
+    def top(self, k=100, period=ALL_TIME, material=ALL_MATERIALS):
+        with self.lock:
+            return self.board(period, material).top(k)
+
+    def rank(self, username, period=ALL_TIME, material=ALL_MATERIALS):
+        with self.lock:
+            return self.board(period, material).rank(username)
+
+    def score(self, username, period=ALL_TIME, material=ALL_MATERIALS):
+        with self.lock:
+            return self.board(period, material).scores.get(username, 0)
+
+    def periods(self):
+        with self.lock:
+            months = sorted({period for period, _ in self.boards if period != ALL_TIME}, reverse=True)
+        return [ALL_TIME] + months